@@ -13,19 +13,20 @@ Steps:
 """
 
 import requests
-import json
+import orjson
 import datetime
 import re
 import base64
 import os
-import difflib
 import time
-import subprocess
 import sys
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
-import winsound
+from rapidfuzz import fuzz, process, utils
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.backends import default_backend
@@ -47,11 +48,24 @@ CLOB_ENDPOINT = "https://clob.polymarket.com"
 
 FUZZY_MATCH_THRESHOLD = 0.50
 
+# Game dates are reported in US Eastern time (DST-aware)
+EASTERN_TZ = ZoneInfo('America/New_York')
+
+# Shared keep-alive sessions so paginated/series requests reuse TCP+TLS connections.
+# pool_maxsize must exceed the ThreadPoolExecutor worker counts below.
+_KALSHI_SESSION = requests.Session()
+_KALSHI_SESSION.mount(KALSHI_BASE_URL, HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+_POLY_SESSION = requests.Session()
+_POLY_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+# CLOB price lookups fan out to many more workers, so they get their own larger pool
+_CLOB_SESSION = requests.Session()
+_CLOB_SESSION.mount(CLOB_ENDPOINT, HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     platform: str
     league: str
@@ -63,12 +77,24 @@ class GameEvent:
     title: str
     url: str
     volume: float
-    raw_data: dict = field(default_factory=dict)
+    clob_token_ids: List[str] = field(default_factory=list)  # Polymarket only: [team1, team2]
 
     @property
     def id(self):
         return f"{self.platform}:{self.league}:{self.date}:{self.team1}vs{self.team2}"
 
+
+# Games keyed by (league, date) so matching only compares games that can overlap
+GameBuckets = Dict[Tuple[str, str], List[GameEvent]]
+
+
+def bucket_games(games: List[GameEvent]) -> GameBuckets:
+    """Group games into (league, date) buckets, preserving input order within each bucket."""
+    buckets: GameBuckets = {}
+    for g in games:
+        buckets.setdefault((g.league, g.date), []).append(g)
+    return buckets
+
 # ============================================================================
 # NORMALIZATION
 # ============================================================================
@@ -240,16 +266,24 @@ POLYMARKET_SERIES = {
 }
 
 
+# Names that are already canonical and can't be remapped. Values that are also
+# alias keys (e.g. 'miami' -> 'heat') are excluded so their lookup still applies.
+_CANONICAL_TEAMS = frozenset(TEAM_ALIASES.values()) - TEAM_ALIASES.keys()
+
+_RANK_PAREN_RE = re.compile(r'\(\d+\)')
+_RANK_HASH_RE = re.compile(r'#\d+')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_KALSHI_DATE_RE = re.compile(r'\d{2}[A-Z]{3}\d{2}')
+
+
+@lru_cache(maxsize=4096)
 def normalize_team(name: str) -> str:
-    """Strip junk, lowercase, resolve aliases."""
-    n = name.lower().strip()
+    """Strip junk, lowercase, resolve aliases. Cached: the same names and ticker codes repeat every scan."""
     # Remove ranking numbers like (1), #25
-    n = re.sub(r'\(\d+\)', '', n)
-    n = re.sub(r'#\d+', '', n)
-    n = n.strip()
-    if n in TEAM_ALIASES:
-        return TEAM_ALIASES[n]
-    return n
+    n = _RANK_HASH_RE.sub('', _RANK_PAREN_RE.sub('', name.lower().strip())).strip()
+    if n in _CANONICAL_TEAMS:
+        return n
+    return TEAM_ALIASES.get(n, n)
 
 
 def normalize_league(league_raw: str) -> str:
@@ -266,18 +300,18 @@ def normalize_date(date_obj_or_str) -> Optional[str]:
             if 'T' in date_obj_or_str:
                 dt = datetime.datetime.fromisoformat(date_obj_or_str.replace('Z', '+00:00'))
                 return dt.strftime('%Y-%m-%d')
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', date_obj_or_str):
+            if _ISO_DATE_RE.match(date_obj_or_str):
                 return date_obj_or_str
         except Exception:
             pass
     return None
 
 
-def calculate_similarity(name1: str, name2: str) -> float:
-    """Return similarity 0.0-1.0 between two normalized team names."""
-    if name1 == name2:
-        return 1.0
-    return difflib.SequenceMatcher(None, name1, name2).ratio()
+def calculate_similarity(name1: str, name2: str, score_cutoff: float = 0.0) -> float:
+    """Return similarity 0.0-1.0 between two normalized team names.
+    Scores below score_cutoff come back as 0.0; RapidFuzz then bails out early on
+    the length bound or a bounded edit distance instead of computing the full ratio."""
+    return fuzz.ratio(name1, name2, score_cutoff=score_cutoff * 100) / 100.0
 
 
 # ============================================================================
@@ -289,14 +323,14 @@ def load_private_key():
         return serialization.load_pem_private_key(f.read(), password=None, backend=default_backend())
 
 
+# Signing parameters are immutable, so build them once instead of per request
+_PSS_PADDING = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH)
+_SHA256 = hashes.SHA256()
+
+
 def create_signature(private_key, timestamp, method, path):
-    path_without_query = path.split('?')[0]
-    message = f"{timestamp}{method}{path_without_query}".encode('utf-8')
-    signature = private_key.sign(
-        message,
-        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
-        hashes.SHA256()
-    )
+    message = timestamp.encode() + method.encode() + path.partition('?')[0].encode()
+    signature = private_key.sign(message, _PSS_PADDING, _SHA256)
     return base64.b64encode(signature).decode('utf-8')
 
 
@@ -310,19 +344,21 @@ def get_private_key():
     return _cached_private_key
 
 
-def kalshi_api_get(path):
+def kalshi_api_get(path, extra_headers=None):
     """Authenticated GET request to Kalshi with retry."""
     for attempt in range(3):
         try:
             private_key = get_private_key()
-            timestamp = str(int(datetime.datetime.now().timestamp() * 1000))
+            timestamp = str(time.time_ns() // 1_000_000)
             signature = create_signature(private_key, timestamp, "GET", path)
             headers = {
                 'KALSHI-ACCESS-KEY': API_KEY_ID,
                 'KALSHI-ACCESS-SIGNATURE': signature,
                 'KALSHI-ACCESS-TIMESTAMP': timestamp
             }
-            return requests.get(KALSHI_BASE_URL + path, headers=headers, timeout=15)
+            if extra_headers:
+                headers.update(extra_headers)
+            return _KALSHI_SESSION.get(KALSHI_BASE_URL + path, headers=headers, timeout=15)
         except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
             if attempt < 2:
                 time.sleep(0.5 * (attempt + 1))
@@ -334,13 +370,41 @@ def kalshi_api_get(path):
     return None
 
 
+# Last ETag and decoded body per request path, kept across scans so unchanged
+# pages come back as 304 Not Modified and skip both the download and the parse.
+# Only first pages are cached (one per series): cursor paths are opaque and change
+# between scans, so caching them would grow without bound in the continuous loop.
+_etag_cache: Dict[str, str] = {}
+_body_cache: Dict[str, dict] = {}
+
+
+def kalshi_api_get_json(path, revalidate=True) -> Optional[dict]:
+    """Authenticated GET returning the decoded JSON body.
+    With revalidate, the path's ETag is sent and its body cached for later scans."""
+    etag = _etag_cache.get(path) if revalidate else None
+    resp = kalshi_api_get(path, {'If-None-Match': etag} if etag else None)
+    if resp is None:
+        return None
+    if resp.status_code == 304 and path in _body_cache:
+        return _body_cache[path]
+    if resp.status_code != 200:
+        return None
+
+    body = orjson.loads(resp.content)
+    etag = resp.headers.get('ETag')
+    if revalidate and etag:
+        _etag_cache[path] = etag
+        _body_cache[path] = body
+    return body
+
+
 def parse_kalshi_date(ticker: str) -> Optional[str]:
     """Extract YYYY-MM-DD from a Kalshi event ticker like KXNBAGAME-26FEB01..."""
     parts = ticker.split('-')
     if len(parts) < 2:
         return None
     date_part = parts[1][:7]  # e.g. 26FEB01
-    if not re.match(r'\d{2}[A-Z]{3}\d{2}', date_part):
+    if not _KALSHI_DATE_RE.match(date_part):
         return None
     mon_map = {
         'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
@@ -364,9 +428,9 @@ def parse_teams_from_title(title: str) -> Optional[Tuple[str, str]]:
     return None
 
 
-def match_market_to_team(market, t1_norm, t2_norm):
-    """Match a Kalshi market sub-ticker to one of the two teams. Returns ('t1', price), ('t2', price), or None."""
-    # Extract price — ONLY use yes_ask (the actual price you'd pay to buy YES)
+def _kalshi_yes_ask(market) -> Optional[float]:
+    """Extract the YES ask price from a Kalshi market, or None if unavailable."""
+    # ONLY use yes_ask (the actual price you'd pay to buy YES)
     price = None
     yes_ask = market.get('yes_ask_dollars')
     if yes_ask:
@@ -386,125 +450,160 @@ def match_market_to_team(market, t1_norm, t2_norm):
                     price = None
             except (ValueError, TypeError):
                 pass
-    if price is None:
-        return None
+    return price
+
 
-    # Extract team code from ticker suffix
+def _market_team_code(market) -> str:
+    """Normalized team code from a Kalshi market ticker suffix (e.g. ...-LAL -> lakers)."""
     m_ticker = market.get('ticker', '')
     code_raw = m_ticker.split('-')[-1].lower() if '-' in m_ticker else ''
-    code_norm = normalize_team(code_raw) if code_raw else ''
+    return normalize_team(code_raw) if code_raw else ''
+
+
+# Scores below this can never change which side a market is assigned to
+# (assignment needs s > 0.4 and a 0.1 lead), so they are skipped entirely.
+_MARKET_MATCH_THRESHOLD = 0.4
+_MARKET_SCORE_FLOOR = _MARKET_MATCH_THRESHOLD - 0.1
+
+
+def score_codes_against_teams(codes: List[str], t1_norm: str, t2_norm: str) -> List[Tuple[float, float]]:
+    """Score every market code of one event against both teams in a single pass.
+    Returns (s1, s2) per code; pairs below _MARKET_SCORE_FLOOR score 0.0."""
+    scores = []
+    for code in codes:
+        if not code:
+            scores.append((0.0, 0.0))
+            continue
+        s1 = calculate_similarity(code, t1_norm, score_cutoff=_MARKET_SCORE_FLOOR)
+        s2 = calculate_similarity(code, t2_norm, score_cutoff=_MARKET_SCORE_FLOOR)
+        scores.append((s1, s2))
+    return scores
 
+
+def match_market_to_team(market, code_norm, s1, s2, t1_norm, t2_norm):
+    """Match a Kalshi market to one of the two teams using precomputed code similarities.
+    Returns 't1', 't2', or None."""
     # Strategy 1: Exact match on normalized code
     if code_norm:
         if code_norm == t1_norm:
-            return 't1', price
+            return 't1'
         if code_norm == t2_norm:
-            return 't2', price
-
-        # Strategy 2: Similarity + substring
-        s1 = calculate_similarity(code_norm, t1_norm)
-        s2 = calculate_similarity(code_norm, t2_norm)
+            return 't2'
 
-        # Substring bonus
+        # Strategy 2: Similarity + substring bonus
         if len(code_norm) >= 2:
             if code_norm in t1_norm:
                 s1 = max(s1, 0.9)
             if code_norm in t2_norm:
                 s2 = max(s2, 0.9)
 
-        threshold = 0.4
-        if s1 > threshold and s1 > s2 + 0.1:
-            return 't1', price
-        if s2 > threshold and s2 > s1 + 0.1:
-            return 't2', price
+        if s1 > _MARKET_MATCH_THRESHOLD and s1 > s2 + 0.1:
+            return 't1'
+        if s2 > _MARKET_MATCH_THRESHOLD and s2 > s1 + 0.1:
+            return 't2'
 
     # Strategy 3: Title containment fallback
     m_title = market.get('title', '').lower()
     if ' vs ' not in m_title and ' at ' not in m_title:
         if t1_norm in m_title:
-            return 't1', price
+            return 't1'
         if t2_norm in m_title:
-            return 't2', price
+            return 't2'
 
     return None
 
 
-def fetch_kalshi_series(series: str) -> List[GameEvent]:
-    """Fetch all open events for a single Kalshi series."""
-    games = []
-    cursor = None
-    league = normalize_league(series)
+def _parse_kalshi_event(event: dict, league: str) -> Optional[GameEvent]:
+    """Parse a single Kalshi event (with nested markets) into a GameEvent if both teams are priced."""
+    ticker = event.get('event_ticker', '')
+    game_date = parse_kalshi_date(ticker)
+    if not game_date:
+        return None
 
-    while True:
-        path = f"/trade-api/v2/events?series_ticker={series}&limit=200&status=open&with_nested_markets=true"
-        if cursor:
-            path += f"&cursor={cursor}"
+    title = event.get('title', '')
+    teams = parse_teams_from_title(title)
+    if not teams:
+        return None
 
-        resp = kalshi_api_get(path)
-        if not resp or resp.status_code != 200:
-            break
+    t1_raw, t2_raw = teams
+    t1_norm = normalize_team(t1_raw)
+    t2_norm = normalize_team(t2_raw)
 
-        body = resp.json()
-        events = body.get('events', [])
-        cursor = body.get('cursor')
+    markets = event.get('markets', [])
+    volume = sum(m.get('volume', 0) for m in markets)
 
-        if not events:
-            break
+    t1_price = None
+    t2_price = None
 
-        for event in events:
-            ticker = event.get('event_ticker', '')
-            game_date = parse_kalshi_date(ticker)
-            if not game_date:
-                continue
+    # Only priced markets can contribute; extract (market, code, price) once, then
+    # score all codes in one batch
+    priced = [(m, _market_team_code(m), price) for m in markets if (price := _kalshi_yes_ask(m)) is not None]
+    scores = score_codes_against_teams([code for _, code, _ in priced], t1_norm, t2_norm)
 
-            title = event.get('title', '')
-            teams = parse_teams_from_title(title)
-            if not teams:
-                continue
+    for (m, code_norm, price), (s1, s2) in zip(priced, scores):
+        side = match_market_to_team(m, code_norm, s1, s2, t1_norm, t2_norm)
+        if side is None:
+            continue
+        if side == 't1':
+            t1_price = price
+        else:
+            t2_price = price
 
-            t1_raw, t2_raw = teams
-            t1_norm = normalize_team(t1_raw)
-            t2_norm = normalize_team(t2_raw)
+    if t1_price is None or t2_price is None:
+        return None
 
-            markets = event.get('markets', [])
-            volume = sum(m.get('volume', 0) for m in markets)
+    return GameEvent(
+        platform='kalshi',
+        league=league,
+        date=game_date,
+        team1=t1_norm,
+        team2=t2_norm,
+        price_team1=t1_price,
+        price_team2=t2_price,
+        title=title,
+        url=f"https://kalshi.com/markets/{ticker}",
+        volume=volume,
+    )
 
-            t1_price = None
-            t2_price = None
 
-            for m in markets:
-                result = match_market_to_team(m, t1_norm, t2_norm)
-                if result is None:
-                    continue
-                side, price = result
-                if side == 't1':
-                    t1_price = price
-                else:
-                    t2_price = price
-
-            if t1_price is not None and t2_price is not None:
-                games.append(GameEvent(
-                    platform='kalshi',
-                    league=league,
-                    date=game_date,
-                    team1=t1_norm,
-                    team2=t2_norm,
-                    price_team1=t1_price,
-                    price_team2=t2_price,
-                    title=title,
-                    url=f"https://kalshi.com/markets/{ticker}",
-                    volume=volume,
-                    raw_data=event,
-                ))
-
-        if not cursor:
-            break
+def fetch_kalshi_series(series: str) -> List[GameEvent]:
+    """Fetch all open events for a single Kalshi series.
+    The next page is requested as soon as its cursor is known, so it downloads
+    while the current page is being parsed. Kalshi's cursor is opaque and the
+    response carries no total count, so pages can't be fanned out concurrently."""
+    games = []
+    league = normalize_league(series)
+    base_path = f"/trade-api/v2/events?series_ticker={series}&limit=200&status=open&with_nested_markets=true"
+
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        in_flight = prefetch.submit(kalshi_api_get_json, base_path)
+
+        while in_flight is not None:
+            body = in_flight.result()
+            in_flight = None
+            if not body:
+                break
+
+            events = body.get('events', [])
+            cursor = body.get('cursor')
+
+            if not events:
+                break
+
+            if cursor:
+                # Cursor pages are fetched fresh; only the series' first page is revalidated
+                in_flight = prefetch.submit(kalshi_api_get_json, f"{base_path}&cursor={cursor}", False)
+
+            for event in events:
+                game = _parse_kalshi_event(event, league)
+                if game:
+                    games.append(game)
 
     return games
 
 
-def fetch_kalshi_games() -> List[GameEvent]:
-    """Fetch all open sports moneyline games from Kalshi in parallel."""
+def fetch_kalshi_games() -> GameBuckets:
+    """Fetch all open sports moneyline games from Kalshi in parallel, bucketed by (league, date)."""
     print(f"Fetching Kalshi markets ({len(KALSHI_SERIES)} series)...")
     all_games = []
 
@@ -524,7 +623,7 @@ def fetch_kalshi_games() -> List[GameEvent]:
                 print(f"  {series}: error - {e}")
 
     print(f"  Total: {len(all_games)} Kalshi moneyline games loaded.\n")
-    return all_games
+    return bucket_games(all_games)
 
 
 # ============================================================================
@@ -543,14 +642,16 @@ POLY_EXCLUDE_PATTERNS = [
     'regular season', 'division winner', 'conference winner',
 ]
 
+# Single alternation so each question is scanned once instead of once per pattern
+_POLY_EXCLUDE_RE = re.compile('|'.join(re.escape(p) for p in POLY_EXCLUDE_PATTERNS))
+
 
 def is_moneyline_market(question: str, outcomes: list) -> bool:
     """Check if this is a straight Team A vs Team B win/loss market."""
     q_lower = question.lower()
 
-    for pattern in POLY_EXCLUDE_PATTERNS:
-        if pattern in q_lower:
-            return False
+    if _POLY_EXCLUDE_RE.search(q_lower):
+        return False
 
     outcome_lower = [o.lower() for o in outcomes]
     if 'over' in outcome_lower or 'under' in outcome_lower:
@@ -580,9 +681,9 @@ def _parse_game_date_eastern(end_date_str: str) -> Optional[str]:
         return None
     try:
         dt = datetime.datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-        # Subtract 5 hours to approximate Eastern time
-        eastern = dt - datetime.timedelta(hours=5)
-        return eastern.strftime('%Y-%m-%d')
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt.astimezone(EASTERN_TZ).strftime('%Y-%m-%d')
     except Exception:
         return normalize_date(end_date_str)
 
@@ -601,16 +702,16 @@ def _detect_league_from_slug(slug: str, tag_league: str) -> str:
     return normalize_league(tag_league)
 
 
-def _fetch_clob_ask(token_id: str) -> Optional[float]:
+def _fetch_clob_ask(token_id: str, session: requests.Session = _CLOB_SESSION) -> Optional[float]:
     """Fetch the best ask price for a single Polymarket CLOB token."""
     try:
-        r = requests.get(
+        r = session.get(
             f"{CLOB_ENDPOINT}/price",
             params={"token_id": token_id, "side": "sell"},
             timeout=5,
         )
         if r.status_code == 200:
-            data = r.json()
+            data = orjson.loads(r.content)
             price = float(data.get('price', 0))
             if 0 < price < 1:
                 return price
@@ -632,7 +733,7 @@ def _parse_polymarket_event(ev: dict, league_hint: str, today_str: str) -> Optio
 
     for m in ev.get('markets', []):
         outcomes_raw = m.get('outcomes', '[]')
-        outcomes = json.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
+        outcomes = orjson.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
 
         if len(outcomes) != 2:
             continue
@@ -642,7 +743,7 @@ def _parse_polymarket_event(ev: dict, league_hint: str, today_str: str) -> Optio
             continue
 
         prices_raw = m.get('outcomePrices', '[]')
-        prices = json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
+        prices = orjson.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
 
         p1, p2 = None, None
         if prices:
@@ -658,10 +759,10 @@ def _parse_polymarket_event(ev: dict, league_hint: str, today_str: str) -> Optio
 
         # Store clobTokenIds for later CLOB ask price lookup
         clob_ids_raw = m.get('clobTokenIds', '[]')
-        clob_ids = json.loads(clob_ids_raw) if isinstance(clob_ids_raw, str) else clob_ids_raw
+        clob_ids = orjson.loads(clob_ids_raw) if isinstance(clob_ids_raw, str) else clob_ids_raw
 
         if p1 is not None and p2 is not None and 0 < p1 < 1 and 0 < p2 < 1:
-            game = GameEvent(
+            return GameEvent(
                 platform='polymarket',
                 league=league,
                 date=game_date,
@@ -672,11 +773,9 @@ def _parse_polymarket_event(ev: dict, league_hint: str, today_str: str) -> Optio
                 title=ev.get('title', ''),
                 url=f"https://polymarket.com/event/{slug}",
                 volume=float(m.get('volume') or 0),
-                raw_data=ev,
+                # CLOB token IDs for the later ask-price update
+                clob_token_ids=clob_ids if len(clob_ids) == 2 else [],
             )
-            # Attach CLOB token IDs for later price update
-            game.raw_data['_clob_token_ids'] = clob_ids if len(clob_ids) == 2 else []
-            return game
 
     return None
 
@@ -696,11 +795,11 @@ def fetch_polymarket_by_tag(league_name: str, tag_slug: str) -> List[GameEvent]:
                 "limit": 100,
                 "offset": offset,
             }
-            r = requests.get(f"{GAMMA_ENDPOINT}/events", params=params, timeout=15)
+            r = _POLY_SESSION.get(f"{GAMMA_ENDPOINT}/events", params=params, timeout=15)
             if r.status_code != 200:
                 break
 
-            chunk = r.json()
+            chunk = orjson.loads(r.content)
             if not chunk:
                 break
 
@@ -734,11 +833,11 @@ def fetch_polymarket_by_series(league_name: str, series_id: str) -> List[GameEve
                 "limit": 100,
                 "offset": offset,
             }
-            r = requests.get(f"{GAMMA_ENDPOINT}/events", params=params, timeout=15)
+            r = _POLY_SESSION.get(f"{GAMMA_ENDPOINT}/events", params=params, timeout=15)
             if r.status_code != 200:
                 break
 
-            chunk = r.json()
+            chunk = orjson.loads(r.content)
             if not chunk:
                 break
 
@@ -757,26 +856,22 @@ def fetch_polymarket_by_series(league_name: str, series_id: str) -> List[GameEve
     return games
 
 
-def fetch_polymarket_games() -> List[GameEvent]:
-    """Fetch all open sports moneyline games from Polymarket using tag_slug + series_id."""
-    total_sources = len(POLYMARKET_TAG_SLUGS) + len(POLYMARKET_SERIES)
-    print(f"Fetching Polymarket markets ({total_sources} sources: tag_slug + series_id)...")
+def fetch_polymarket_games() -> GameBuckets:
+    """Fetch all open sports moneyline games from Polymarket, bucketed by (league, date).
+    tag_slug sources are queried first; series_id is only queried for leagues whose
+    tag_slug came back empty (or that have no tag_slug at all)."""
+    print(f"Fetching Polymarket markets ({len(POLYMARKET_TAG_SLUGS)} tag_slug sources, series_id fallback)...")
     all_games = []
     seen_slugs = set()  # deduplicate across tag_slug and series_id results
 
-    with ThreadPoolExecutor(max_workers=8) as ex:
-        futures = {}
-        # Primary: tag_slug approach (much more comprehensive)
-        for name, tag in POLYMARKET_TAG_SLUGS.items():
-            futures[ex.submit(fetch_polymarket_by_tag, name, tag)] = f"tag:{name}"
-        # Fallback: series_id approach
-        for name, sid in POLYMARKET_SERIES.items():
-            futures[ex.submit(fetch_polymarket_by_series, name, sid)] = f"series:{name}"
-
+    def collect(futures) -> Dict[str, int]:
+        """Merge finished futures into all_games; return games returned per league."""
+        counts = {}
         for f in as_completed(futures):
-            source = futures[f]
+            name, source = futures[f]
             try:
                 result = f.result()
+                counts[name] = len(result)
                 new_count = 0
                 for g in result:
                     # Deduplicate by event slug (from URL)
@@ -789,20 +884,95 @@ def fetch_polymarket_games() -> List[GameEvent]:
                     print(f"  {source}: {new_count} new games")
             except Exception as e:
                 print(f"  {source}: error - {e}")
+        return counts
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        # Primary: tag_slug approach (much more comprehensive)
+        tag_futures = {
+            ex.submit(fetch_polymarket_by_tag, name, tag): (name, f"tag:{name}")
+            for name, tag in POLYMARKET_TAG_SLUGS.items()
+        }
+        tag_counts = collect(tag_futures)
+
+        # Fallback: series_id, only for leagues the tag_slug pass didn't cover
+        series_futures = {
+            ex.submit(fetch_polymarket_by_series, name, sid): (name, f"series:{name}")
+            for name, sid in POLYMARKET_SERIES.items()
+            if not tag_counts.get(name)
+        }
+        collect(series_futures)
 
     print(f"  Total: {len(all_games)} Polymarket moneyline games loaded.\n")
-    return all_games
+    return bucket_games(all_games)
 
 
 # ============================================================================
 # MATCHING ENGINE
 # ============================================================================
 
-def _score_team_pair(name_a: str, name_b: str) -> float:
-    """Score similarity between two team names with substring boost."""
+@lru_cache(maxsize=8192)
+def _fold_name(name: str) -> str:
+    """Scoring form of a team name (lowercase, punctuation stripped), computed once per name."""
+    return utils.default_process(name)
+
+
+@lru_cache(maxsize=8192)
+def _trigrams(name: str) -> frozenset:
+    """3-character substrings of a team name's scoring form (empty if it's shorter)."""
+    folded = _fold_name(name)
+    return frozenset(folded[i:i + 3] for i in range(len(folded) - 2))
+
+
+def _build_trigram_index(p_list: List[GameEvent], candidates: List[int]) -> Dict[str, set]:
+    """Map each trigram of the candidates' team names to the positions containing it."""
+    index: Dict[str, set] = {}
+    for j in candidates:
+        p_game = p_list[j]
+        for tg in _trigrams(p_game.team1) | _trigrams(p_game.team2):
+            index.setdefault(tg, set()).add(j)
+    return index
+
+
+def _prune_candidates(k_game: GameEvent, candidates: List[int], index: Dict[str, set]) -> List[int]:
+    """Candidates sharing at least one trigram with either Kalshi team name, in the
+    original order. Falls back to every candidate when a name is too short to
+    produce trigrams or nothing overlaps, so pruning never leaves a game unscored."""
+    k_grams1, k_grams2 = _trigrams(k_game.team1), _trigrams(k_game.team2)
+    if not k_grams1 or not k_grams2:
+        return candidates
+    hits = set()
+    for tg in k_grams1 | k_grams2:
+        hits.update(index.get(tg, ()))
+    if not hits:
+        return candidates
+    return [j for j in candidates if j in hits]
+
+
+def _fill_similarity_table(sims: Dict[Tuple[str, str], float], k_names, p_names) -> None:
+    """Score every Kalshi name against every Polymarket name in one batch, into sims.
+    One rapidfuzz.process.extract call (a C loop) per Kalshi name replaces a
+    Python-level ratio call per pair. Pairs already in sims are skipped, so
+    overlapping ±1 day windows and repeat opponents are only scored once per scan.
+    Names are folded with default_process: edge punctuation is stripped and internal
+    punctuation becomes spaces, so 'ohio st.' and 'ohio st' compare equal but
+    "st. john's" and 'st johns' do not. Folding happens once up front so RapidFuzz
+    runs without a processor."""
+    for k_name in k_names:
+        missing = [p_name for p_name in p_names if (k_name, p_name) not in sims]
+        if not missing:
+            continue
+        folded = [_fold_name(p_name) for p_name in missing]
+        for _, score, idx in process.extract(_fold_name(k_name), folded, scorer=fuzz.ratio,
+                                             processor=None, limit=None):
+            sims[(k_name, missing[idx])] = score / 100.0
+
+
+def _score_team_pair(name_a: str, name_b: str, sims: Dict[Tuple[str, str], float]) -> float:
+    """Score similarity between a Kalshi and a Polymarket team name with substring boost,
+    using ratios precomputed by _fill_similarity_table."""
     if name_a == name_b:
         return 1.0
-    score = calculate_similarity(name_a, name_b)
+    score = sims[(name_a, name_b)]
     if len(name_a) >= 3 and name_a in name_b:
         score = max(score, 0.9)
     if len(name_b) >= 3 and name_b in name_a:
@@ -810,78 +980,145 @@ def _score_team_pair(name_a: str, name_b: str) -> float:
     return score
 
 
-def match_games(kalshi_games: List[GameEvent], poly_games: List[GameEvent]) -> list:
-    """Match identical games across Kalshi and Polymarket using league bucketing with ±1 day tolerance."""
-    # Build league-based buckets (date is checked with tolerance)
-    league_buckets: Dict[str, Dict[str, List[GameEvent]]] = {}
-
-    for g in kalshi_games:
-        league_buckets.setdefault(g.league, {'kalshi': [], 'poly': []})['kalshi'].append(g)
-
-    for g in poly_games:
-        league_buckets.setdefault(g.league, {'kalshi': [], 'poly': []})['poly'].append(g)
+@lru_cache(maxsize=1024)
+def _adjacent_dates(date_str: str) -> Tuple[str, ...]:
+    """Return (day, day before, day after) as YYYY-MM-DD strings, or () if unparseable.
+    The same day comes first so lookups prefer a same-date listing over a neighbour's,
+    e.g. when two teams play back-to-back games.
+    Cached, so each distinct date is parsed once no matter how many leagues use it."""
+    try:
+        day = datetime.date.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return ()
+    one_day = datetime.timedelta(days=1)
+    return (day.isoformat(), (day - one_day).isoformat(), (day + one_day).isoformat())
+
+
+def match_games(kalshi_buckets: GameBuckets, poly_buckets: GameBuckets) -> list:
+    """Match identical games across Kalshi and Polymarket.
+    Hash-joins (league, date) buckets so each Kalshi game is only compared against
+    Polymarket games in the same league within ±1 day."""
+    k_by_league: Dict[str, List[GameEvent]] = {}
+    for (league, _), games in kalshi_buckets.items():
+        k_by_league.setdefault(league, []).extend(games)
+
+    # Polymarket games are flattened into one list per league; date buckets and the
+    # exact-name index hold positions into it, so "already matched" is a flag per position.
+    p_by_league: Dict[str, List[GameEvent]] = {}
+    p_positions: Dict[Tuple[str, str], List[int]] = {}
+    # Exact-name index: most games carry identical normalized names on both
+    # platforms, so try an O(1) lookup before any fuzzy scoring
+    exact_index: Dict[tuple, List[int]] = {}
+    for (league, date), games in poly_buckets.items():
+        p_list = p_by_league.setdefault(league, [])
+        for g in games:
+            j = len(p_list)
+            p_list.append(g)
+            p_positions.setdefault((league, date), []).append(j)
+            exact_index.setdefault((league, date, frozenset((g.team1, g.team2))), []).append(j)
 
     matches = []
-    used_poly = set()  # prevent duplicate poly matches
+    sims: Dict[Tuple[str, str], float] = {}  # (kalshi name, poly name) -> ratio, memoized for this scan
 
     print("Matching games across platforms...")
-    for league, groups in sorted(league_buckets.items()):
-        k_list = groups['kalshi']
-        p_list = groups['poly']
-
-        if not k_list or not p_list:
+    for league, k_list in sorted(k_by_league.items()):
+        p_list = p_by_league.get(league)
+        if not p_list:
             continue
 
         print(f"  {league}: {len(k_list)} Kalshi × {len(p_list)} Polymarket")
 
-        for k_game in k_list:
-            best_match = None
-            best_score = 0.0
-            swap_teams = False
+        used = [False] * len(p_list)  # prevent duplicate poly matches
+        fuzzy_pairs = []  # (score, kalshi game, poly position, swap) above threshold
 
-            # Parse Kalshi date for ±1 day comparison
-            try:
-                k_date = datetime.datetime.strptime(k_game.date, '%Y-%m-%d')
-            except (ValueError, TypeError):
+        # Group Kalshi games by date: every game on a date shares the same ±1 day
+        # candidate set, so candidates and name similarities are computed once per date.
+        k_by_date: Dict[str, List[GameEvent]] = {}
+        for k_game in k_list:
+            k_by_date.setdefault(k_game.date, []).append(k_game)
+
+        for k_date, k_day in k_by_date.items():
+            candidates = [
+                j
+                for date in _adjacent_dates(k_date)
+                for j in p_positions.get((league, date), ())
+            ]
+            if not candidates:
                 continue
 
-            for p_game in p_list:
-                if id(p_game) in used_poly:
-                    continue
-
-                # ±1 day tolerance on dates
-                try:
-                    p_date = datetime.datetime.strptime(p_game.date, '%Y-%m-%d')
-                except (ValueError, TypeError):
-                    continue
-                if abs((k_date - p_date).days) > 1:
+            # Exact pass first, so an exact pair can't be taken by an earlier fuzzy match.
+            # Same-date listings are tried before D-1/D+1 (see _adjacent_dates).
+            unresolved = []
+            for k_game in k_day:
+                teams_key = frozenset((k_game.team1, k_game.team2))
+                exact_j = next((
+                    j
+                    for date in _adjacent_dates(k_date)
+                    for j in exact_index.get((league, date, teams_key), ())
+                    if not used[j]
+                ), None)
+                if exact_j is None:
+                    unresolved.append(k_game)
                     continue
+                used[exact_j] = True
+                exact = p_list[exact_j]
+                matches.append({
+                    'kalshi': k_game,
+                    'poly': exact,
+                    'score': 1.0,
+                    'swap': exact.team1 != k_game.team1,
+                })
 
-                # Straight comparison: K.t1↔P.t1 and K.t2↔P.t2
-                s1_str = _score_team_pair(k_game.team1, p_game.team1)
-                s2_str = _score_team_pair(k_game.team2, p_game.team2)
-                avg_straight = (s1_str + s2_str) / 2
-
-                # Cross comparison: K.t1↔P.t2 and K.t2↔P.t1
-                s1_cross = _score_team_pair(k_game.team1, p_game.team2)
-                s2_cross = _score_team_pair(k_game.team2, p_game.team1)
-                avg_cross = (s1_cross + s2_cross) / 2
+            if not unresolved:
+                continue
 
-                current_score = max(avg_straight, avg_cross)
+            # Only score each game against candidates sharing a trigram with its names
+            trigram_index = _build_trigram_index(p_list, candidates)
+            pruned = [_prune_candidates(g, candidates, trigram_index) for g in unresolved]
 
-                if current_score > best_score and current_score > FUZZY_MATCH_THRESHOLD:
-                    best_score = current_score
-                    best_match = p_game
-                    swap_teams = (avg_cross > avg_straight)
+            _fill_similarity_table(
+                sims,
+                {name for g in unresolved for name in (g.team1, g.team2)},
+                {name for js in pruned for j in js for name in (p_list[j].team1, p_list[j].team2)},
+            )
 
-            if best_match:
-                used_poly.add(id(best_match))
-                matches.append({
-                    'kalshi': k_game,
-                    'poly': best_match,
-                    'score': best_score,
-                    'swap': swap_teams,
-                })
+            for k_game, k_candidates in zip(unresolved, pruned):
+                for j in k_candidates:
+                    if used[j]:
+                        continue
+                    p_game = p_list[j]
+
+                    # Straight comparison: K.t1↔P.t1 and K.t2↔P.t2
+                    s1_str = _score_team_pair(k_game.team1, p_game.team1, sims)
+                    s2_str = _score_team_pair(k_game.team2, p_game.team2, sims)
+                    avg_straight = (s1_str + s2_str) / 2
+
+                    # Cross comparison: K.t1↔P.t2 and K.t2↔P.t1
+                    s1_cross = _score_team_pair(k_game.team1, p_game.team2, sims)
+                    s2_cross = _score_team_pair(k_game.team2, p_game.team1, sims)
+                    avg_cross = (s1_cross + s2_cross) / 2
+
+                    current_score = max(avg_straight, avg_cross)
+                    if current_score > FUZZY_MATCH_THRESHOLD:
+                        fuzzy_pairs.append((current_score, k_game, j, avg_cross > avg_straight))
+
+        # Assign fuzzy pairs best-first across the whole league, so a Kalshi game with
+        # a single plausible partner can't lose it to an earlier game's weaker match.
+        # On equal scores a same-date pair wins: the same teams playing back-to-back
+        # score identically, and pairing across days would price the wrong game.
+        fuzzy_pairs.sort(key=lambda pair: (pair[0], pair[1].date == p_list[pair[2]].date), reverse=True)
+        assigned = set()
+        for score, k_game, j, swap_teams in fuzzy_pairs:
+            if used[j] or id(k_game) in assigned:
+                continue
+            used[j] = True
+            assigned.add(id(k_game))
+            matches.append({
+                'kalshi': k_game,
+                'poly': p_list[j],
+                'score': score,
+                'swap': swap_teams,
+            })
 
     print(f"  Matched {len(matches)} games.\n")
     return matches
@@ -898,12 +1135,18 @@ def fmt(price) -> str:
     return f"${price:.2f}"
 
 
+def _aligned_poly(m):
+    """Polymarket (t1 name, t2 name, t1 price, t2 price) aligned so t1 corresponds to Kalshi team1."""
+    p = m['poly']
+    if m['swap']:
+        return p.team2, p.team1, p.price_team2, p.price_team1
+    return p.team1, p.team2, p.price_team1, p.price_team2
+
+
 def _arb_cost(m):
     """Compute the minimum combined ask cost for a matched game."""
     k = m['kalshi']
-    swap = m['swap']
-    p_t1_price = m['poly'].price_team2 if swap else m['poly'].price_team1
-    p_t2_price = m['poly'].price_team1 if swap else m['poly'].price_team2
+    _, _, p_t1_price, p_t2_price = _aligned_poly(m)
     cost1 = (k.price_team1 or 1.0) + (p_t2_price or 1.0)
     cost2 = (k.price_team2 or 1.0) + (p_t1_price or 1.0)
     return min(cost1, cost2)
@@ -917,21 +1160,29 @@ def print_matches(matches):
     # Filter to only matches with confidence strictly > 67%
     matches = [m for m in matches if m['score'] > 0.67]
 
+    # Compute each combined cost once, in a single pass; the print loop reuses it
+    for m in matches:
+        m['cost'] = _arb_cost(m)
+
     # Only keep profitable matches (min_cost < $0.99)
-    profitable = [m for m in matches if _arb_cost(m) < 0.99]
+    profitable = [m for m in matches if m['cost'] < 0.99]
 
     separator = "=" * 110
 
-    print(separator)
-    print(f"  MONEYLINE BETS ON BOTH KALSHI & POLYMARKET")
-    print(f"  Total matching games found:     {total_matches}")
-    print(f"  High-confidence (>67%):         {len(matches)}")
-    print(f"  Profitable (cost < $0.99):      {len(profitable)}")
-    print(separator)
+    # Lines are collected and written in one call rather than one print per line
+    out = [
+        separator,
+        f"  MONEYLINE BETS ON BOTH KALSHI & POLYMARKET",
+        f"  Total matching games found:     {total_matches}",
+        f"  High-confidence (>67%):         {len(matches)}",
+        f"  Profitable (cost < $0.99):      {len(profitable)}",
+        separator,
+    ]
 
     if not profitable:
-        print("\n  No profitable arbitrage opportunities found (all combined ask costs >= $0.99).")
-        print(f"\n{separator}")
+        out.append("\n  No profitable arbitrage opportunities found (all combined ask costs >= $0.99).")
+        out.append(f"\n{separator}")
+        sys.stdout.write("\n".join(out) + "\n")
         return profitable
 
     # Sort profitable by league then date
@@ -942,57 +1193,75 @@ def print_matches(matches):
     for i, m in enumerate(profitable, 1):
         k = m['kalshi']
         p = m['poly']
-        swap = m['swap']
 
         # Align teams: K.team1 should correspond to P.team1
-        if not swap:
-            p_t1_name = p.team1
-            p_t2_name = p.team2
-            p_t1_price = p.price_team1
-            p_t2_price = p.price_team2
-        else:
-            p_t1_name = p.team2
-            p_t2_name = p.team1
-            p_t1_price = p.price_team2
-            p_t2_price = p.price_team1
+        p_t1_name, p_t2_name, p_t1_price, p_t2_price = _aligned_poly(m)
 
         # League header
         if k.league != current_league:
             current_league = k.league
-            print(f"\n  {'----'} {current_league} {'----'}")
-
-        min_cost = _arb_cost(m)
-
-        # Print game
-        print(f"\n  {i}. {k.title}  ({k.date})")
-        print(f"     Match confidence: {m['score']:.0%}")
-        print(f"     {'':>20}  {'Team 1':>20}  {'Team 2':>20}")
-        print(f"     {'Kalshi (ask)':>20}  {fmt(k.price_team1):>20}  {fmt(k.price_team2):>20}")
-        print(f"     {'Polymarket (ask)':>20}  {fmt(p_t1_price):>20}  {fmt(p_t2_price):>20}")
-        print(f"     Kalshi teams:     {k.team1} / {k.team2}")
-        print(f"     Poly teams:       {p_t1_name} / {p_t2_name}")
-        print(f"     Kalshi volume:    {int(k.volume):,}    | {k.url}")
-        print(f"     Poly volume:      {int(p.volume):,}    | {p.url}")
-        print(f"       *** ARBITRAGE: combined ${min_cost:.2f} ***")
-
-    print(f"\n{separator}")
-    print(f"\n  >>> {len(profitable)} profitable arbitrage opportunities found!")
+            out.append(f"\n  {'----'} {current_league} {'----'}")
+
+        min_cost = m['cost']
+
+        # Game block
+        out.append(f"\n  {i}. {k.title}  ({k.date})")
+        out.append(f"     Match confidence: {m['score']:.0%}")
+        out.append(f"     {'':>20}  {'Team 1':>20}  {'Team 2':>20}")
+        out.append(f"     {'Kalshi (ask)':>20}  {fmt(k.price_team1):>20}  {fmt(k.price_team2):>20}")
+        out.append(f"     {'Polymarket (ask)':>20}  {fmt(p_t1_price):>20}  {fmt(p_t2_price):>20}")
+        out.append(f"     Kalshi teams:     {k.team1} / {k.team2}")
+        out.append(f"     Poly teams:       {p_t1_name} / {p_t2_name}")
+        out.append(f"     Kalshi volume:    {int(k.volume):,}    | {k.url}")
+        out.append(f"     Poly volume:      {int(p.volume):,}    | {p.url}")
+        out.append(f"       *** ARBITRAGE: combined ${min_cost:.2f} ***")
+
+    out.append(f"\n{separator}")
+    out.append(f"\n  >>> {len(profitable)} profitable arbitrage opportunities found!")
+    sys.stdout.write("\n".join(out) + "\n")
     return profitable
 
 
+# Shared win10toast notifier, created on first alert. A single instance is needed:
+# show_toast only reports a toast still on screen for the instance that showed it,
+# and a second instance registering its window class while one is up fails silently.
+_toaster = None
+
+
+def _get_toaster():
+    """Return the shared ToastNotifier, or False if win10toast isn't installed."""
+    global _toaster
+    if _toaster is None:
+        try:
+            from win10toast import ToastNotifier
+            _toaster = ToastNotifier()
+        except ImportError:
+            _toaster = False
+    return _toaster
+
+
 def send_notification(profitable_matches):
     """Send system-wide Windows notification for profitable arbitrage matches.
     Uses multiple methods to ensure the user is alerted even when in other apps:
     1. System beep sounds (always audible)
     2. Windows balloon tip notification (visible in system tray)
+    On other platforms this is a no-op, so the scanner itself runs anywhere.
     """
+    if sys.platform != 'win32':
+        print("  >> Desktop alerts are only supported on Windows; skipping notification.")
+        return
+
+    # Windows-only modules, imported here so the scanner can start on any platform
+    import subprocess
+    import winsound
+
     count = len(profitable_matches)
 
     # Build notification text
     lines = []
     for m in profitable_matches[:3]:
         k = m['kalshi']
-        cost = _arb_cost(m)
+        cost = m['cost']
         profit_cents = int((1.0 - cost) * 100)
         lines.append(f"{k.title} - ${cost:.2f} cost (+{profit_cents}c profit)")
     body = "\r\n".join(lines)
@@ -1012,6 +1281,20 @@ def send_notification(profitable_matches):
         print(f"  >> Sound alert failed: {e}")
 
     # --- Method 2: System tray balloon notification (visible system-wide) ---
+    # Prefer the in-process toast when win10toast is installed; it avoids the
+    # PowerShell/.NET startup on every alert. Fall back to the balloon script.
+    toaster = _get_toaster()
+    if toaster:
+        try:
+            # show_toast returns False without showing anything while this notifier's
+            # previous toast is still on screen, which happens when alerts arrive in bursts
+            if toaster.show_toast(title, body.replace('\r\n', '\n'), duration=10, threaded=True):
+                print("  >> Toast notification sent!")
+                return
+            print("  >> Toast already on screen, falling back to balloon.")
+        except Exception as e:
+            print(f"  >> Toast notification failed, falling back to balloon: {e}")
+
     ps_title = title.replace('"', '`"').replace("'", "''")
     ps_body = body.replace('"', '`"').replace("'", "''")
 
@@ -1046,7 +1329,7 @@ def update_poly_prices_from_clob(matches: list):
     lookups = []  # (match_idx, token_id, team_num)
     for i, m in enumerate(matches):
         poly = m['poly']
-        clob_ids = poly.raw_data.get('_clob_token_ids', [])
+        clob_ids = poly.clob_token_ids
         if len(clob_ids) == 2:
             lookups.append((i, clob_ids[0], 1))
             lookups.append((i, clob_ids[1], 2))
@@ -1057,23 +1340,14 @@ def update_poly_prices_from_clob(matches: list):
 
     print(f"Fetching actual ask prices from Polymarket CLOB ({len(lookups)} tokens)...")
 
-    results = {}  # (match_idx, team_num) -> price
-    with ThreadPoolExecutor(max_workers=10) as ex:
-        future_map = {}
-        for match_idx, token_id, team_num in lookups:
-            fut = ex.submit(_fetch_clob_ask, token_id)
-            future_map[fut] = (match_idx, team_num)
-        for fut in as_completed(future_map):
-            key = future_map[fut]
-            try:
-                price = fut.result()
-                if price is not None:
-                    results[key] = price
-            except Exception:
-                pass
+    # _fetch_clob_ask swallows its own errors, so map() results line up with lookups
+    with ThreadPoolExecutor(max_workers=32) as ex:
+        prices = list(ex.map(_fetch_clob_ask, [token_id for _, token_id, _ in lookups]))
 
     updated = 0
-    for (match_idx, team_num), price in results.items():
+    for (match_idx, _, team_num), price in zip(lookups, prices):
+        if price is None:
+            continue
         poly = matches[match_idx]['poly']
         if team_num == 1:
             poly.price_team1 = price
@@ -1098,10 +1372,14 @@ def main():
         print(f"{'#'*110}\n")
 
         try:
-            kalshi_games = fetch_kalshi_games()
-            poly_games = fetch_polymarket_games()
-
-            matches = match_games(kalshi_games, poly_games)
+            # The two platforms are independent hosts, so fetch them side by side
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                kalshi_future = ex.submit(fetch_kalshi_games)
+                poly_future = ex.submit(fetch_polymarket_games)
+                kalshi_buckets = kalshi_future.result()
+                poly_buckets = poly_future.result()
+
+            matches = match_games(kalshi_buckets, poly_buckets)
 
             # Update Polymarket prices with actual CLOB ask prices
             update_poly_prices_from_clob(matches)
@@ -6,10 +6,13 @@ Shows Feb 2026 games with YES ask prices for both teams.
 """
 
 import requests
-import datetime
+import orjson
 import base64
 import os
+import sys
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from cryptography.hazmat.primitives import serialization, hashes
@@ -25,6 +28,19 @@ BASE_URL = os.getenv('KALSHI_BASE_URL', 'https://api.elections.kalshi.com/')
 if not API_KEY_ID or not PRIVATE_KEY_PATH:
     raise RuntimeError('Missing KALSHI_API_KEY or KALSHI_PRIVATE_KEY_PATH in .env')
 
+# Shared keep-alive session so the per-series requests reuse TCP+TLS connections
+# (pool sized above the 15 fetch workers). Connection errors, 429s and 5xx are
+# retried by urllib3 with exponential backoff.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+
 
 def load_private_key(key_path=None):
     """Load the private key from file."""
@@ -33,26 +49,38 @@ def load_private_key(key_path=None):
         return serialization.load_pem_private_key(f.read(), password=None, backend=default_backend())
 
 
+# RSA-PSS parameters are immutable, so build them once rather than per request
+_PSS_PADDING = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH)
+_SHA256 = hashes.SHA256()
+
+
 def create_signature(private_key, timestamp, method, path):
     """Create the request signature for Kalshi API authentication."""
-    path_without_query = path.split('?')[0]
-    message = f"{timestamp}{method}{path_without_query}".encode('utf-8')
-    signature = private_key.sign(
-        message,
-        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
-        hashes.SHA256()
-    )
+    message = timestamp.encode() + method.encode() + path.partition('?')[0].encode()
+    signature = private_key.sign(message, _PSS_PADDING, _SHA256)
     return base64.b64encode(signature).decode('utf-8')
 
 
+# Cache the private key so we only load it once
+_cached_private_key = None
+
+
+def get_private_key():
+    """Return the default private key, loading it from disk on first use."""
+    global _cached_private_key
+    if _cached_private_key is None:
+        _cached_private_key = load_private_key()
+    return _cached_private_key
+
+
 def api_get(path, private_key=None, api_key_id=None):
     """Make an authenticated GET request to the Kalshi API with retry logic."""
     if private_key is None:
-        private_key = load_private_key()
+        private_key = get_private_key()
     if api_key_id is None:
         api_key_id = API_KEY_ID
     
-    timestamp = str(int(datetime.datetime.now().timestamp() * 1000))
+    timestamp = str(time.time_ns() // 1_000_000)
     signature = create_signature(private_key, timestamp, "GET", path)
     
     headers = {
@@ -61,17 +89,11 @@ def api_get(path, private_key=None, api_key_id=None):
         'KALSHI-ACCESS-TIMESTAMP': timestamp
     }
     
-    # Retry logic for SSL errors
-    for attempt in range(3):
-        try:
-            resp = requests.get(BASE_URL + path, headers=headers, timeout=30)
-            return resp
-        except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
-            if attempt < 2:
-                time.sleep(0.5 * (attempt + 1))
-            else:
-                return None
-    return None
+    # Retries happen in the session's adapter; give up quietly once they're exhausted
+    try:
+        return _SESSION.get(BASE_URL + path, headers=headers, timeout=30)
+    except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
+        return None
 
 
 # All sports game series from Kalshi
@@ -115,7 +137,7 @@ def get_sports_markets(series_list=None, limit=200):
         if resp is None or resp.status_code != 200:
             return []
         
-        events = resp.json().get('events', [])
+        events = orjson.loads(resp.content).get('events', [])
         results = []
         
         for event in events:
@@ -163,6 +185,9 @@ def get_sports_markets(series_list=None, limit=200):
     
     all_results = []
     
+    # Pre-load the private key before spawning threads
+    get_private_key()
+
     # Fetch all series in parallel
     print(f"Fetching {len(series_list)} sports series with nested markets...")
     with ThreadPoolExecutor(max_workers=15) as executor:
@@ -224,6 +249,8 @@ def main():
     print(f"Feb 2026 events: {len(events)}")
     print("-" * 80)
     
+    # Collect the per-event lines and write them in one call
+    out = []
     for i, (event_base, data) in enumerate(sorted_events, 1):
         title = data['title'][:55]
         series = data['series']
@@ -249,13 +276,16 @@ def main():
             if combined < 1.0:
                 combined_str += " *** ARBITRAGE ***"
         
-        print(f"{i}. [{series}] {title}")
-        print(f"   {prices_str}")
+        out.append(f"{i}. [{series}] {title}")
+        out.append(f"   {prices_str}")
         if combined_str:
-            print(f"   {combined_str} | Volume: {total_vol:,}")
+            out.append(f"   {combined_str} | Volume: {total_vol:,}")
         else:
-            print(f"   Volume: {total_vol:,}")
-        print()
+            out.append(f"   Volume: {total_vol:,}")
+        out.append("")
+    
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':
@@ -7,13 +7,46 @@ No authentication required for read-only operations.
 """
 
 import requests
-import json
+import orjson
+import re
+import sys
+import logging
 import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Progress messages from the fetchers; main() output stays on print
+log = logging.getLogger(__name__)
 
 # API Endpoints
 GAMMA_ENDPOINT = "https://gamma-api.polymarket.com"
 
+# Shared keep-alive session so paginated requests reuse TCP+TLS connections
+# (pool sized to the 15 fetch workers). requests already asks for gzip bodies.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=15, pool_maxsize=15,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
+
+@dataclass(slots=True)
+class Market:
+    """A two-team moneyline market with its outcome prices."""
+    question: str
+    slug: str
+    team1: str                 # first outcome name
+    team2: str                 # second outcome name
+    price_team1: float
+    price_team2: float
+    volume: int
+    outcomes: List[str]
+    series: str
+    platform: str = 'polymarket'
+
 
 # Patterns that indicate NON-game markets (spreads, O/U, props, etc.)
 EXCLUDE_PATTERNS = [
@@ -26,107 +59,212 @@ EXCLUDE_PATTERNS = [
     '+', '-',  # Spread indicators like (-3.5) or (+3.5)
 ]
 
+# Single alternation so each question is scanned once instead of once per pattern
+_EXCLUDE_RE = re.compile('|'.join(re.escape(p) for p in EXCLUDE_PATTERNS))
+
+# Outcome names that mark O/U or Yes/No prop markets rather than two teams
+_BAD_OUTCOMES = frozenset({'over', 'under', 'yes', 'no'})
 
-def is_straight_game_matchup(question, outcomes):
+# Question text that marks a head-to-head game
+_GAME_INDICATORS = (' vs ', ' vs. ', ' at ', 'winner')
+
+# Feb 2026 date markers found in game slugs (e.g. nba-bos-mia-2026-02-15)
+_FEB_2026_SLUG_RE = re.compile(r'2026-02|-26-02-')
+
+# Game slug: a sports prefix (sport-team1-team2-date) plus a Feb 2026 date, in one match.
+# The prefix is a lookahead so the date may reuse its trailing dash, as '-26-02-' can.
+_GAME_SLUG_RE = re.compile(r'^(?=(?:nba|nfl|nhl|mlb|ufc|ncaa|boxing|tennis)-).*?(?:2026-02|-26-02-)')
+
+
+def is_straight_game_matchup(q_lower, outcome_lower):
     """
     Check if this is a straight Team A vs Team B win/loss game.
     Returns True only for simple "who wins" matchups.
+    Takes the question and outcomes already lowercased by the caller.
     """
-    q_lower = question.lower()
-    
     # Exclude non-game markets (spreads, O/U, props, political, etc.)
-    for pattern in EXCLUDE_PATTERNS:
-        if pattern in q_lower:
-            return False
-    
-    # Check if outcomes look like team names (not Over/Under, Yes/No for props)
-    outcome_lower = [o.lower() for o in outcomes]
-    
-    # Exclude O/U markets
-    if 'over' in outcome_lower or 'under' in outcome_lower:
+    if _EXCLUDE_RE.search(q_lower):
         return False
     
-    # Exclude Yes/No prop markets (unless it's a fight)
-    if 'yes' in outcome_lower or 'no' in outcome_lower:
+    # Check if outcomes look like team names (not Over/Under, Yes/No for props)
+    # Exclude O/U markets and Yes/No prop markets (unless it's a fight)
+    if not _BAD_OUTCOMES.isdisjoint(outcome_lower):
         return False
     
     # Must have "vs" or "vs." or "at" or teams in question for game matchups
-    game_indicators = [' vs ', ' vs. ', ' at ', 'winner']
-    if not any(ind in q_lower for ind in game_indicators):
+    if not any(ind in q_lower for ind in _GAME_INDICATORS):
         return False
     
     return True
 
 
-def is_feb_2026_game(event):
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str):
+    """Parse an ISO date (e.g., "2026-02-15T00:00:00Z"), or None if invalid.
+    Cached, since many events share the same end date."""
+    try:
+        if 'T' in date_str:
+            return datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return datetime.datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_team_prices(outcomes, prices):
+    """
+    Return (price_team1, price_team2) for a two-outcome market, or None unless
+    the outcomes differ and both prices are strictly between 0 and 1.
+    """
+    if len(prices) < 2 or outcomes[0] == outcomes[1]:
+        return None
+    try:
+        price1, price2 = float(prices[0]), float(prices[1])
+    except (ValueError, TypeError):
+        return None
+    if 0 < price1 < 1 and 0 < price2 < 1:
+        return price1, price2
+    return None
+
+
+def is_feb_2026_game(event, now=None):
     """
     Check if event is a Feb 2026 game that hasn't happened yet.
+    Pass `now` (UTC) when checking many events to read the clock only once.
     """
-    # Get end date from event
+    # Cheap check first: slug date patterns (e.g., nba-bos-mia-2026-02-15)
+    slug = event.get('slug', '').lower()
+    if _FEB_2026_SLUG_RE.search(slug):
+        return True
+    
+    # Otherwise parse the end date from the event
     end_date_str = event.get('endDate') or event.get('end_date_iso')
     
     if end_date_str:
         try:
-            # Parse ISO date (e.g., "2026-02-15T00:00:00Z")
-            if 'T' in end_date_str:
-                end_date = datetime.datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-            else:
-                end_date = datetime.datetime.fromisoformat(end_date_str)
+            end_date = _parse_iso(end_date_str)
             
             # Check if it's Feb 2026
-            if end_date.year == 2026 and end_date.month == 2:
+            if end_date is not None and end_date.year == 2026 and end_date.month == 2:
                 # Check if it hasn't happened yet
-                now = datetime.datetime.now(datetime.timezone.utc)
+                if now is None:
+                    now = datetime.datetime.now(datetime.timezone.utc)
                 if end_date > now:
                     return True
-        except (ValueError, TypeError):
+        except TypeError:
             pass
     
-    # Fallback: check slug for date patterns (e.g., nba-bos-mia-2026-02-15)
-    slug = event.get('slug', '').lower()
-    if '2026-02' in slug or '-26-02-' in slug:
-        return True
-    
     return False
 
 
-def fetch_sports_events(series_name, series_id):
-    """Fetch events for a specific sports series."""
-    events = []
-    offset = 0
-    page_size = 100
+# Gamma API page size for paginated /events and /markets requests
+PAGE_SIZE = 100
+
+# Pages requested up front per list before knowing whether they exist
+PREFETCH_PAGES = 3
+
+# Cap on markets scanned by the slug-based fallback
+FALLBACK_MAX_MARKETS = 2000
+
+# End-date window pushed to the Gamma API so it only returns plausible Feb 2026 games.
+# The upper bound leaves slack for late games that end on Mar 1 UTC and markets that
+# resolve a few days after the game; is_feb_2026_game and the slug check stay the exact filter.
+END_DATE_MIN = '2026-02-01T00:00:00Z'
+END_DATE_MAX = '2026-03-08T00:00:00Z'
+
+# Paginated query URLs, built once; callers append only the per-request parts
+_DATE_WINDOW = f"end_date_min={END_DATE_MIN}&end_date_max={END_DATE_MAX}"
+_EVENTS_URL = f"{GAMMA_ENDPOINT}/events?active=true&closed=false&{_DATE_WINDOW}&limit={PAGE_SIZE}"
+_MARKETS_URL = f"{GAMMA_ENDPOINT}/markets?active=true&closed=false&{_DATE_WINDOW}&limit={PAGE_SIZE}"
+
+def gamma_get_json(url):
+    """GET a Gamma API URL and return the decoded JSON, or None on a non-200 status."""
+    resp = _SESSION.get(url, timeout=30)
+    if resp.status_code != 200:
+        return None
+    return orjson.loads(resp.content)
+
+
+def fetch_page(url):
+    """Fetch one page of a paginated Gamma list endpoint. Returns [] on error."""
+    try:
+        data = gamma_get_json(url)
+    except Exception:
+        return []
+    return data or []
+
+
+def paginate(base_urls, prefetch=PREFETCH_PAGES, max_items=None, max_workers=15):
+    """
+    Fetch every page of one or more Gamma list URLs through one shared worker pool.
+    `base_urls` maps a caller's key to a URL without an offset; returns {key: items}.
+    
+    The first `prefetch` pages of each URL are requested at once, so a short list
+    costs one round trip instead of one per page. A URL whose last requested page
+    comes back full gets its next window queued; once a short page marks the end,
+    its later pages are cancelled. Pages are merged in offset order, up to the
+    first short page. `max_items` caps how far each URL is paged.
+    """
+    limit = max_items if max_items is not None else sys.maxsize
+    pages = {key: {} for key in base_urls}  # key -> {offset: page}
+    next_offset = {}
     
-    while True:
-        params = {
-            'series_id': series_id,
-            'active': 'true',
-            'closed': 'false',
-            'limit': page_size,
-            'offset': offset
-        }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
         
-        try:
-            resp = requests.get(f"{GAMMA_ENDPOINT}/events", params=params, timeout=30)
-            if resp.status_code != 200:
-                break
-            
-            data = resp.json()
-            if not data:
-                break
-            
-            for event in data:
-                event['series_name'] = series_name
-            
-            events.extend(data)
-            offset += len(data)
-            
-            if len(data) < page_size:
-                break
+        def submit_window(key, start):
+            stop = min(start + prefetch * PAGE_SIZE, limit)
+            for offset in range(start, stop, PAGE_SIZE):
+                url = f"{base_urls[key]}&offset={offset}"
+                pending[executor.submit(fetch_page, url)] = (key, offset)
+            next_offset[key] = stop
+        
+        for key in base_urls:
+            submit_window(key, 0)
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, offset = pending.pop(future)
+                page = future.result()
+                pages[key][offset] = page
                 
-        except Exception:
-            break
+                if len(page) < PAGE_SIZE:
+                    # End of this list: drop any later pages not yet started
+                    for f, (k, o) in list(pending.items()):
+                        if k == key and o > offset and f.cancel():
+                            del pending[f]
+                elif offset + PAGE_SIZE == next_offset[key] and next_offset[key] < limit:
+                    submit_window(key, next_offset[key])
+    
+    results = {}
+    for key, by_offset in pages.items():
+        items = results[key] = []
+        for offset in sorted(by_offset):
+            page = by_offset[offset]
+            items.extend(page)
+            if len(page) < PAGE_SIZE:
+                break
+    return results
+
+
+def fetch_sports_events(series, max_workers=15):
+    """
+    Fetch every page of events for all series, tagging each event with its series name.
+    An event listed under several series is returned once, under the first of them.
+    """
+    by_series = paginate(
+        {name: f"{_EVENTS_URL}&series_id={sid}" for name, sid in series.items()},
+        max_workers=max_workers,
+    )
     
-    return events
+    events = {}  # event id -> event
+    for name, series_events in by_series.items():
+        for event in series_events:
+            key = event.get('id', id(event))
+            if key not in events:
+                event['series_name'] = name
+                events[key] = event
+    return list(events.values())
 
 
 def get_sports_markets():
@@ -138,31 +276,20 @@ def get_sports_markets():
     - Two-team win/loss outcomes (no spreads, O/U, props)
     - Games that haven't happened yet
     
-    Returns list of markets with outcomes and prices.
+    Returns list of Market objects with outcomes and prices.
     """
-    all_events = []
+    log.info("Fetching %d sports series from Polymarket...", len(SPORTS_SERIES))
     
-    print(f"Fetching {len(SPORTS_SERIES)} sports series from Polymarket...")
-    
-    # Fetch all series in parallel
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {
-            executor.submit(fetch_sports_events, name, sid): name 
-            for name, sid in SPORTS_SERIES.items()
-        }
-        for future in as_completed(futures):
-            try:
-                events = future.result()
-                all_events.extend(events)
-            except Exception:
-                pass
+    # Fetch all series in parallel, page by page
+    all_events = fetch_sports_events(SPORTS_SERIES)
     
     # Filter and process events
     sports_markets = []
+    now = datetime.datetime.now(datetime.timezone.utc)
     
     for event in all_events:
         # Filter for Feb 2026 games only
-        if not is_feb_2026_game(event):
+        if not is_feb_2026_game(event, now):
             continue
         
         # Get markets from event
@@ -174,9 +301,9 @@ def get_sports_markets():
             prices_raw = m.get('outcomePrices', '[]')
             
             try:
-                outcomes = json.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
-                prices = json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
-            except (json.JSONDecodeError, TypeError):
+                outcomes = orjson.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
+                prices = orjson.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
+            except (orjson.JSONDecodeError, TypeError):
                 continue
             
             # Only include markets with exactly 2 outcomes (two teams, win/loss)
@@ -186,40 +313,31 @@ def get_sports_markets():
             question = m.get('question', '') or event.get('title', '')
             
             # Only include straight game matchups (no spreads, O/U, props)
-            if not is_straight_game_matchup(question, outcomes):
+            if not is_straight_game_matchup(question.lower(), [o.lower() for o in outcomes]):
                 continue
             
-            # Build teams dict with prices
-            teams = {}
-            total_volume = int(float(m.get('volume', 0) or 0))
-            
-            for i, outcome in enumerate(outcomes):
-                if i < len(prices):
-                    try:
-                        price = float(prices[i])
-                        if 0 < price < 1:
-                            teams[outcome] = price
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Only include if we have prices for exactly 2 teams
-            if len(teams) == 2:
-                sports_markets.append({
-                    'question': question,
-                    'slug': m.get('slug', '') or event.get('slug', ''),
-                    'teams': teams,
-                    'volume': total_volume,
-                    'outcomes': outcomes,
-                    'series': event.get('series_name', 'SPORTS'),
-                    'platform': 'polymarket'
-                })
+            # Only include if we have prices for both teams
+            team_prices = parse_team_prices(outcomes, prices)
+            if team_prices:
+                total_volume = int(float(m.get('volume', 0) or 0))
+                sports_markets.append(Market(
+                    question=question,
+                    slug=m.get('slug', '') or event.get('slug', ''),
+                    team1=outcomes[0],
+                    team2=outcomes[1],
+                    price_team1=team_prices[0],
+                    price_team2=team_prices[1],
+                    volume=total_volume,
+                    outcomes=outcomes,
+                    series=event.get('series_name', 'SPORTS'),
+                ))
     
     # If no events found via series, fall back to slug-based filtering
     if not sports_markets:
-        print("No events from series API, falling back to market search...")
+        log.info("No events from series API, falling back to market search...")
         sports_markets = get_sports_markets_fallback()
     
-    print(f"Found {len(sports_markets)} Feb 2026 sports markets")
+    log.info("Found %d Feb 2026 sports markets", len(sports_markets))
     return sports_markets
 
 
@@ -243,40 +361,12 @@ def get_sports_markets_fallback():
     Fallback: Fetch markets and filter by slug pattern for game matchups.
     Looks for slugs like: nba-bos-mia-2026-02-15, nfl-buf-kc-2026-02-01
     """
-    all_markets = []
-    offset = 0
-    page_size = 100
-    
-    # Game slug patterns: sport-team1-team2-date
-    game_patterns = [
-        'nba-', 'nfl-', 'nhl-', 'mlb-', 'ufc-', 'ncaa-', 'boxing-', 'tennis-'
-    ]
-    
-    while len(all_markets) < 2000:
-        params = {
-            'active': 'true',
-            'closed': 'false',
-            'limit': page_size,
-            'offset': offset
-        }
-        
-        try:
-            resp = requests.get(f"{GAMMA_ENDPOINT}/markets", params=params, timeout=30)
-            if resp.status_code != 200:
-                break
-            
-            markets = resp.json()
-            if not markets:
-                break
-            
-            all_markets.extend(markets)
-            offset += len(markets)
-            
-            if len(markets) < page_size:
-                break
-                
-        except Exception:
-            break
+    # The cap is known up front, so request every page of it at once
+    all_markets = paginate(
+        {'markets': _MARKETS_URL},
+        prefetch=FALLBACK_MAX_MARKETS // PAGE_SIZE,
+        max_items=FALLBACK_MAX_MARKETS,
+    )['markets']
     
     sports_markets = []
     
@@ -284,12 +374,8 @@ def get_sports_markets_fallback():
         slug = m.get('slug', '').lower()
         question = m.get('question', '')
         
-        # Must start with a sports prefix
-        if not any(slug.startswith(p) for p in game_patterns):
-            continue
-        
-        # Must have date pattern in slug (indicates actual game, not futures)
-        if '2026-02' not in slug and '-26-02-' not in slug:
+        # Must start with a sports prefix and carry a Feb 2026 date (an actual game, not futures)
+        if not _GAME_SLUG_RE.match(slug):
             continue
         
         # Parse outcomes and prices
@@ -297,9 +383,9 @@ def get_sports_markets_fallback():
         prices_raw = m.get('outcomePrices', '[]')
         
         try:
-            outcomes = json.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
-            prices = json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
-        except (json.JSONDecodeError, TypeError):
+            outcomes = orjson.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
+            prices = orjson.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
+        except (orjson.JSONDecodeError, TypeError):
             continue
         
         # Only include markets with exactly 2 outcomes
@@ -307,35 +393,28 @@ def get_sports_markets_fallback():
             continue
         
         # Only include straight game matchups
-        if not is_straight_game_matchup(question, outcomes):
+        if not is_straight_game_matchup(question.lower(), [o.lower() for o in outcomes]):
             continue
         
-        # Build teams dict
-        teams = {}
-        total_volume = int(float(m.get('volume', 0) or 0))
-        
-        for i, outcome in enumerate(outcomes):
-            if i < len(prices):
-                try:
-                    price = float(prices[i])
-                    if 0 < price < 1:
-                        teams[outcome] = price
-                except (ValueError, TypeError):
-                    pass
-        
-        if len(teams) == 2:
+        # Only include if we have prices for both teams
+        team_prices = parse_team_prices(outcomes, prices)
+        if team_prices:
+            total_volume = int(float(m.get('volume', 0) or 0))
+            
             # Extract series from slug
             series = slug.split('-')[0].upper()
             
-            sports_markets.append({
-                'question': question,
-                'slug': slug,
-                'teams': teams,
-                'volume': total_volume,
-                'outcomes': outcomes,
-                'series': series,
-                'platform': 'polymarket'
-            })
+            sports_markets.append(Market(
+                question=question,
+                slug=slug,
+                team1=outcomes[0],
+                team2=outcomes[1],
+                price_team1=team_prices[0],
+                price_team2=team_prices[1],
+                volume=total_volume,
+                outcomes=outcomes,
+                series=series,
+            ))
     
     return sports_markets
 
@@ -357,46 +436,46 @@ def main():
         return
     
     # Filter for markets with volume > 0
-    active = [m for m in markets if m.get('volume', 0) > 0]
+    active = [m for m in markets if m.volume > 0]
     
     # Sort by volume ascending (like kalshi)
-    active.sort(key=lambda x: x.get('volume', 0))
+    active.sort(key=attrgetter('volume'))
     
     print(f"\nTotal markets: {len(markets)}")
     print(f"Active markets (volume > 0): {len(active)}")
     print(f"Feb 2026 events: {len(active)}")
     print("-" * 80)
     
+    # Collect the per-market lines and write them in one call
+    out = []
     for i, m in enumerate(active, 1):
-        question = m.get('question', '')[:55]
-        series = m.get('series', 'SPORTS')
-        teams = m.get('teams', {})
-        volume = m.get('volume', 0)
+        question = m.question[:55]
+        series = m.series
+        volume = m.volume
         
-        # Build team prices string
-        team_prices = []
-        for team, price in sorted(teams.items()):
-            team_prices.append(f"{team}: ${price:.2f}")
+        # Build team prices string, teams in name order
+        team_prices = [f"{m.team1}: ${m.price_team1:.2f}", f"{m.team2}: ${m.price_team2:.2f}"]
+        if m.team2 < m.team1:
+            team_prices.reverse()
         
         prices_str = " | ".join(team_prices)
         
         # Calculate combined cost
-        asks = list(teams.values())
-        combined_str = ""
-        if len(asks) >= 2:
-            combined = sum(asks)
-            combined_str = f"Combined: ${combined:.2f}"
-            if combined < 1.0:
-                combined_str += " *** ARBITRAGE ***"
+        combined = m.price_team1 + m.price_team2
+        combined_str = f"Combined: ${combined:.2f}"
+        if combined < 1.0:
+            combined_str += " *** ARBITRAGE ***"
         
-        print(f"{i}. [{series}] {question}")
-        print(f"   {prices_str}")
-        if combined_str:
-            print(f"   {combined_str} | Volume: {volume:,}")
-        else:
-            print(f"   Volume: {volume:,}")
-        print()
+        out.append(f"{i}. [{series}] {question}")
+        out.append(f"   {prices_str}")
+        out.append(f"   {combined_str} | Volume: {volume:,}")
+        out.append("")
+    
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':
+    # Show fetch progress on stdout alongside the listing; importers configure their own logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     main()